@@ -318,6 +318,9 @@ class Actions(ResilientComponent):
         self.listeners = dict()
         self._proxy_args = {}
 
+        # Set once the ComponentLoader has registered every component
+        self._all_components_loaded = False
+
         # messages and acks that failed to send over stomp connection
         self._stomp_ack_delivery_failures = {}
         self._resilient_ack_delivery_failures = {}
@@ -687,8 +690,15 @@ class Actions(ResilientComponent):
                 # Defer subscribing until all components are loaded
 
     @handler("load_all_success", "subscribe_to_all")
-    def subscribe_to_queues(self):
+    def subscribe_to_queues(self, event):
         """ Subscribe to all message queues """
+        if event.name == "load_all_success":
+            self._all_components_loaded = True
+        elif getattr(self.parent, "auto_load_components", False) and not self._all_components_loaded:
+            # e.g. a reconnect while the components are still loading in the background.
+            # Wait for load_all_success so no messages arrive for a partly registered queue
+            LOG.debug("Components are still loading, not subscribing to message destinations yet")
+            return
         if not self.stomp_component:
             return
         if not self.stomp_component.connected:
@@ -12,9 +12,15 @@ handlers, and acknowledge the messages when they have been processed.
 
 from __future__ import print_function
 
+import atexit
+import errno
 import logging
+import socket
+import sys
+import threading
 from logging.handlers import RotatingFileHandler
 from six import string_types
+from six.moves import queue
 import re
 import os
 import filelock
@@ -23,13 +29,59 @@ from resilient import get_config_file
 from resilient import constants as resilient_constants
 from resilient_circuits import constants, helpers
 from resilient_circuits.app_argument_parser import AppArgumentParser
-from resilient_circuits.component_loader import ComponentLoader
+from resilient_circuits.component_loader import ComponentLoader, load_all_failure
 from resilient_circuits.actions_component import Actions, ResilientComponent
 
+if sys.version_info.major >= 3:
+    # QueueHandler and QueueListener are not available in PY2.7
+    from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import fcntl
+except ImportError:
+    # fcntl is not available on Windows, where we fall back to filelock
+    fcntl = None
 
 application = None
 logging_initialized = False
 
+# Resolved once at import instead of calling expanduser each time
+_HOME = os.path.expanduser("~")
+_RESILIENT_DIR = os.path.join(_HOME, ".resilient")
+
+# Names accepted for 'loglevel' -> numeric logging level
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.FATAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARN,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET
+}
+
+# (logdir, logfile) -> expanded path of the log file
+_LOG_PATH_CACHE = {}
+
+
+def _resolved_log_path(logdir, logfile):
+    """
+    Return the expanded path of logfile in logdir,
+    caching the result for the (logdir, logfile) pair
+
+    :param logdir: directory for log files, may start with '~'
+    :type logdir: str
+    :param logfile: name of the log file
+    :type logfile: str
+    :return: expanded path to the log file
+    :rtype: str
+    """
+    key = (logdir, logfile)
+    if key not in _LOG_PATH_CACHE:
+        _LOG_PATH_CACHE[key] = os.path.expanduser(os.path.join(logdir, logfile))
+    return _LOG_PATH_CACHE[key]
+
 
 class RedactingFilter(logging.Filter):
     """ Redacting logging filter to prevent Resilient circuits sensitive password values from being logged.
@@ -57,6 +109,11 @@ class App(Component):
     SYSLOG_LOG_FORMAT = '%(module)s: %(levelname)s %(message)s'
     STDERR_LOG_FORMAT = '%(asctime)s %(levelname)s [%(module)s] %(message)s'
 
+    # Formatters hold no per-handler state, so they are built once and shared
+    FILE_LOG_FORMATTER = logging.Formatter(FILE_LOG_FORMAT)
+    SYSLOG_LOG_FORMATTER = logging.Formatter(SYSLOG_LOG_FORMAT)
+    STDERR_LOG_FORMATTER = logging.Formatter(STDERR_LOG_FORMAT)
+
     def __init__(self, auto_load_components=True, config_file=None, ALLOW_UNRECOGNIZED=False, IS_SELFTEST=False):
         super(App, self).__init__()
         # Read the configuration options
@@ -65,6 +122,10 @@ class App(Component):
         self.IS_SELFTEST = IS_SELFTEST
         self.action_component = None
         self.component_loader = None
+        self._log_listener = None
+        self._log_queue_handler = None
+        self._log_handlers = []
+        self._component_loader_thread = None
         self.auto_load_components = auto_load_components
         self.config_file = config_file or get_config_file()
         self.do_initialization()
@@ -103,23 +164,21 @@ class App(Component):
         self.action_component.register(self)
 
         # Register a `loader` to dynamically load
-        # all Circuits components in the 'componentsdir' directory
+        # all Circuits components in the 'componentsdir' directory.
+        # The first time, this is done in the background once the App has started
         if self.auto_load_components:
             LOG.info("Components auto-load directory: %s",
                      self.opts["componentsdir"] or "(none)")
-            if not self.component_loader:
-                self.component_loader = ComponentLoader(self.opts)
-            else:
+            if self.component_loader:
                 LOG.info("Updating and re-registering ComponentLoader")
                 self.component_loader.opts = self.opts
-            self.component_loader.register(self)
+                self.component_loader.register(self)
 
     def config_logging(self, logdir, loglevel, logfile):
         """ set up some logging """
         global LOG_PATH, LOG, logging_initialized
 
-        LOG_PATH = os.path.join(logdir, logfile)
-        LOG_PATH = os.path.expanduser(LOG_PATH)
+        LOG_PATH = _resolved_log_path(logdir, logfile)
         LOG = logging.getLogger(__name__)
 
         # Only do this once! (mostly for pytest)
@@ -131,30 +190,52 @@ class App(Component):
         # Ignore syslog errors from message-too-long
         logging.raiseExceptions = False
 
-        try:
-            numeric_level = getattr(logging, loglevel)
-            logging.getLogger().setLevel(numeric_level)
-        except AttributeError as e:
+        numeric_level = _LOG_LEVELS.get(loglevel.upper() if loglevel else None)
+        if numeric_level is None:
             logging.getLogger().setLevel(logging.INFO)
             LOG.warning("Invalid logging level specified. Using INFO level")
+        else:
+            logging.getLogger().setLevel(numeric_level)
 
         LOG.addFilter(RedactingFilter())
 
         file_handler = RotatingFileHandler(LOG_PATH, maxBytes=10000000,
                                            backupCount=10)
-        file_handler.setFormatter(logging.Formatter(self.FILE_LOG_FORMAT))
+        file_handler.setFormatter(self.FILE_LOG_FORMATTER)
         file_handler.addFilter(RedactingFilter())
-        logging.getLogger().addHandler(file_handler)
 
-        syslog = logging.handlers.SysLogHandler()
-        syslog.setFormatter(logging.Formatter(self.SYSLOG_LOG_FORMAT))
-        syslog.addFilter(RedactingFilter())
-        logging.getLogger().addHandler(syslog)
+        handlers = [file_handler]
+
+        # syslog is opt-in with 'enable_syslog=True' in the [resilient] section.
+        # Use a non-blocking UDP socket so a slow or missing syslog daemon
+        # never stalls the thread that is logging
+        if self.opts.get("enable_syslog"):
+            syslog = logging.handlers.SysLogHandler(socktype=socket.SOCK_DGRAM)
+            syslog.socket.setblocking(False)
+            syslog.setFormatter(self.SYSLOG_LOG_FORMATTER)
+            syslog.addFilter(RedactingFilter())
+            handlers.append(syslog)
 
         stderr = logging.StreamHandler()
-        stderr.setFormatter(logging.Formatter(self.STDERR_LOG_FORMAT))
+        stderr.setFormatter(self.STDERR_LOG_FORMATTER)
         stderr.addFilter(RedactingFilter())
-        logging.getLogger().addHandler(stderr)
+        handlers.append(stderr)
+
+        if sys.version_info.major < 3:
+            for handler in handlers:
+                logging.getLogger().addHandler(handler)
+        else:
+            # The thread that logs only puts the record on a queue. The
+            # handlers do their I/O on the QueueListener's background thread
+            log_queue = queue.Queue(-1)
+            self._log_queue_handler = QueueHandler(log_queue)
+            self._log_queue_handler.addFilter(RedactingFilter())
+            self._log_handlers = handlers
+            logging.getLogger().addHandler(self._log_queue_handler)
+
+            self._log_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+            self._log_listener.start()
+            atexit.register(self._stop_log_listener)
 
         if LOG.getEffectiveLevel() == logging.DEBUG:
             self += Debugger(logger=LOG)
@@ -190,10 +271,113 @@ class App(Component):
     def started(self, event, component):
         """Started Event Handler"""
         LOG.info("App Started")
+        self._start_component_loader()
+
+    def registered(self, event, component, parent):
+        """Registered Event Handler"""
+        if component is self and parent.root.running:
+            # The App was registered with a Manager that is already running
+            # (e.g. in pytest-resilient-circuits) so 'started' is not fired for it
+            self._start_component_loader()
+
+    def _start_component_loader(self):
+        """
+        Import and register the components on a background thread, so the
+        event loop can connect to STOMP while they load. Actions does not
+        subscribe to message destinations until it has seen load_all_success
+        (a subscribe_to_all from a reconnect before then is ignored), so no
+        messages are received before the components are registered
+        """
+        # Keep the Thread on this thread before starting it, as component_loader
+        # is only set once the ComponentLoader has been created on the new thread
+        if not self.auto_load_components or self._component_loader_thread or self.component_loader:
+            return
+
+        self._component_loader_thread = threading.Thread(target=self._load_components, name="component_loader")
+        self._component_loader_thread.daemon = True
+        self._component_loader_thread.start()
+
+    def _load_components(self):
+        """Create the ComponentLoader and register it. Runs on the component_loader thread"""
+        try:
+            self.component_loader = ComponentLoader(self.opts)
+            self.component_loader.register(self)
+        except Exception:
+            LOG.exception("Failed to load components")
+            self.fire(load_all_failure())
 
     def stopped(self, event, component):
         """Stopped Event Handler"""
         LOG.info("App Stopped")
+        self._stop_log_listener()
+
+    def _stop_log_listener(self):
+        """
+        Process any queued log records and stop the QueueListener thread.
+        Then swap the QueueHandler on the root logger for the handlers it fed,
+        so anything logged afterwards (e.g. by a later App in the same
+        process, which will not configure logging again) is still written
+        """
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
+
+            root_logger = logging.getLogger()
+            root_logger.removeHandler(self._log_queue_handler)
+            for handler in self._log_handlers:
+                root_logger.addHandler(handler)
+
+        self._log_queue_handler = None
+        self._log_handlers = []
+
+
+class _FlockFileLock(object):
+    """
+    Exclusive, non-blocking lock on a file using a single fcntl.flock call.
+
+    Implements the parts of the filelock.FileLock interface used by run().
+    Instead of polling until the timeout expires, acquire() fails straight
+    away with filelock.Timeout if another process holds the lock
+    """
+
+    def __init__(self, lock_file):
+        self.lock_file = lock_file
+        self._lock_file_fd = None
+
+    @property
+    def is_locked(self):
+        return self._lock_file_fd is not None
+
+    def acquire(self, timeout=None):
+        """
+        Lock the file. ``timeout`` is accepted for compatibility with
+        filelock but is not used as flock is called with LOCK_NB
+
+        :raises filelock.Timeout: if the file is locked by another process
+        """
+        fd = os.open(self.lock_file, os.O_CREAT | os.O_RDWR, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except (IOError, OSError) as e:
+            os.close(fd)
+            if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EACCES):
+                raise filelock.Timeout(self.lock_file)
+            raise
+        self._lock_file_fd = fd
+        return self
+
+    def release(self):
+        """Unlock and close the file"""
+        if self._lock_file_fd is not None:
+            fcntl.flock(self._lock_file_fd, fcntl.LOCK_UN)
+            os.close(self._lock_file_fd)
+            self._lock_file_fd = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
 
 
 def get_lock():
@@ -205,12 +389,20 @@ def get_lock():
     app_lock_file = os.environ.get("APP_LOCK_FILE", "")
 
     if not app_lock_file:
-        lockfile = os.path.expanduser(os.path.join("~", ".resilient", "resilient_circuits_lockfile"))
-        resilient_dir = os.path.dirname(lockfile)
-        if not os.path.exists(resilient_dir):
-            os.makedirs(resilient_dir)
+        lockfile = os.path.join(_RESILIENT_DIR, "resilient_circuits_lockfile")
+        # Just try to create it: one mkdir instead of a stat + mkdir, and no
+        # race if another process creates it in between (no exist_ok in PY2.7)
+        try:
+            os.makedirs(_RESILIENT_DIR)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
     else:
         lockfile = os.path.expanduser(app_lock_file)
+
+    if fcntl:
+        return _FlockFileLock(lockfile)
+
     lock = filelock.FileLock(lockfile)
     return lock
 
@@ -10,6 +10,36 @@ from resilient_circuits.validate_configs import VALIDATE_DICT
 from resilient_circuits.helpers import validate_configs
 from resilient_circuits import constants
 
+# Latest parsed ConfigParser for each config file path, stored as
+# {path: ((mtime, size), config)}. Lets reload_opts() skip re-reading the
+# file when it has not changed. Only one entry is kept per path
+_CONFIG_CACHE = {}
+
+# First characters of config values that are considered True
+_TRUE_FIRST_CHARS = frozenset("1tTyY")
+
+
+def _get_config_cache_key(config_file):
+    """
+    Return the absolute path of config_file and a stamp that identifies
+    its current contents. The stamp is None if the file cannot be stat'ed.
+
+    Uses st_mtime_ns where available so edits within the same second are
+    detected; falls back to st_mtime on Python 2.7
+
+    :param config_file: path to the app.config file
+    :type config_file: str
+    :return: (path, (mtime, size)) of the file; (path, None) if it cannot be stat'ed
+    :rtype: tuple
+    """
+    path_config_file = os.path.abspath(os.path.expanduser(config_file))
+    try:
+        stat_result = os.stat(path_config_file)
+    except (OSError, IOError):
+        return path_config_file, None
+    mtime = getattr(stat_result, "st_mtime_ns", stat_result.st_mtime)
+    return path_config_file, (mtime, stat_result.st_size)
+
 
 class AppArgumentParser(keyring_arguments.ArgumentParser):
     """Helper to parse command line arguments."""
@@ -32,7 +62,21 @@ class AppArgumentParser(keyring_arguments.ArgumentParser):
         temp_handler.setLevel(logging.INFO)
         logging.getLogger().addHandler(temp_handler)
         config_file = config_file or get_config_file()
-        super(AppArgumentParser, self).__init__(config_file=config_file)
+
+        path_config_file, cache_stamp = _get_config_cache_key(config_file)
+        cached_stamp, cached_config = _CONFIG_CACHE.get(path_config_file, (None, None))
+        if cache_stamp is None or cache_stamp != cached_stamp:
+            cached_config = None
+
+        if cached_config is not None:
+            # File is unchanged since we last read it, so reuse the parsed config
+            self.config = cached_config
+            super(AppArgumentParser, self).__init__(config_file=None)
+        else:
+            super(AppArgumentParser, self).__init__(config_file=config_file)
+            if cache_stamp is not None and self.config is not None:
+                # Replaces any stale entry for this path
+                _CONFIG_CACHE[path_config_file] = (cache_stamp, self.config)
 
         default_components_dir = self.getopt(self.DEFAULT_APP_SECTION, "componentsdir") or self.DEFAULT_COMPONENTS_DIR
         default_noload = self.getopt(self.DEFAULT_APP_SECTION, "noload") or ""
@@ -62,6 +106,8 @@ class AppArgumentParser(keyring_arguments.ArgumentParser):
                                             "log_http_responses") or ""
         default_resource_prefix = self.getopt(self.DEFAULT_APP_SECTION, "resource_prefix") or None
         default_num_workers = self.getopt(self.DEFAULT_APP_SECTION, "num_workers") or self.DEFAULT_NUM_WORKERS
+        default_enable_syslog = self._is_true(self.getopt(self.DEFAULT_APP_SECTION,
+                                                          "enable_syslog")) or False
 
         logging.getLogger().removeHandler(temp_handler)
 
@@ -148,13 +194,17 @@ class AppArgumentParser(keyring_arguments.ArgumentParser):
                           default=default_num_workers,
                           help=("Number of FunctionWorkers to use. "
                                 "Number of Functions that can run in parallel"))
+        self.add_argument("--enable-syslog",
+                          action="store_true",
+                          default=default_enable_syslog,
+                          help="Also send log messages to syslog")
 
     def parse_args(self, args=None, namespace=None, ALLOW_UNRECOGNIZED=False):
         """Parse commandline arguments and construct an opts dictionary"""
         opts = super(AppArgumentParser, self).parse_args(args, namespace, ALLOW_UNRECOGNIZED)
         if self.config:
             for section in self.config.sections():
-                items = dict((item.lower(), self.config.get(section, item)) for item in self.config.options(section))
+                items = {key.lower(): value for key, value in self.config.items(section, raw=True)}
                 opts.update({section: items})
 
             parse_parameters(opts)
@@ -165,7 +215,4 @@ class AppArgumentParser(keyring_arguments.ArgumentParser):
 
     @staticmethod
     def _is_true(value):
-        if value:
-            return value.lower()[0] in ("1", "t", "y")
-        else:
-            return False
+        return bool(value) and value[:1] in _TRUE_FIRST_CHARS
@@ -100,12 +100,14 @@ class AppRestartable(App):
 
     def started(self, component):
         LOG.info("App Started %s", str(component))
+        self._start_component_loader()
         self.do_initialize_watchdog()
 
     def stopped(self, component):
         """Stopped Event Handler"""
         LOG.info("App Stopped")
         self._stop_observer()
+        self._stop_log_listener()
 
     def reload_complete(self, event, *args, **kwargs):
         """ All components done handling reload event """
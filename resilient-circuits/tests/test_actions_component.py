@@ -3,6 +3,9 @@
 # (c) Copyright IBM Corp. 2010, 2021. All Rights Reserved.
 
 import pytest
+from circuits import Event
+from mock import MagicMock, patch
+from resilient_circuits.actions_component import Actions
 from resilient_lib import IntegrationError
 from tests import helpers, mock_constants, MockInboundAppComponent
 
@@ -17,3 +20,23 @@ def test_inbound_cmp_raises_error_no_app_configs(circuits_app):
     mock_cmp.register(circuits_app.app.component_loader)
     with pytest.raises(IntegrationError, match=r"does not have app_configs defined"):
         helpers.call_inbound_app(circuits_app, mock_constants.MOCK_INBOUND_Q_NAME)
+
+
+def test_subscribe_to_all_waits_for_load_all_success():
+    mock_actions = Actions.__new__(Actions)
+    mock_actions.parent = MagicMock(auto_load_components=True)
+    mock_actions.stomp_component = MagicMock(connected=True)
+    mock_actions.listeners = {"mock_queue": set([MagicMock()])}
+    mock_actions._all_components_loaded = False
+
+    with patch.object(Actions, "_subscribe") as mock_subscribe:
+        # e.g. a reconnect while the ComponentLoader is still registering components
+        list(mock_actions.subscribe_to_queues(Event.create("subscribe_to_all")))
+        mock_subscribe.assert_not_called()
+
+        list(mock_actions.subscribe_to_queues(Event.create("load_all_success")))
+        mock_subscribe.assert_called_once_with("mock_queue")
+
+        # once loaded, a reconnect resubscribes
+        list(mock_actions.subscribe_to_queues(Event.create("subscribe_to_all")))
+        assert mock_subscribe.call_count == 2
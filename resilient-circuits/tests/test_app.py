@@ -0,0 +1,150 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# (c) Copyright IBM Corp. 2010, 2022. All Rights Reserved.
+
+import logging
+import os
+import sys
+import filelock
+import pytest
+from mock import patch
+from six.moves import queue
+from resilient_circuits import app, app_restartable
+
+
+def test_get_lock(monkeypatch, tmpdir):
+    path_lock_file = os.path.join(str(tmpdir), "mock_lockfile")
+    monkeypatch.setenv("APP_LOCK_FILE", path_lock_file)
+
+    lock = app.get_lock()
+    assert lock.lock_file == path_lock_file
+
+    with lock.acquire(timeout=1):
+        assert lock.is_locked
+
+        # A second lock on the same file fails instead of waiting
+        with pytest.raises(filelock.Timeout):
+            app.get_lock().acquire(timeout=1)
+
+    assert not lock.is_locked
+
+    # Once released it can be locked again
+    with app.get_lock().acquire(timeout=1) as second_lock:
+        assert second_lock.is_locked
+
+
+def test_resolved_log_path():
+    log_path = app._resolved_log_path("~/logs", "app.log")
+    assert log_path == os.path.expanduser(os.path.join("~", "logs", "app.log"))
+    assert app._resolved_log_path("~/logs", "app.log") is log_path
+
+
+@pytest.mark.parametrize("loglevel, expected_level, is_invalid", [
+    ("debug", logging.DEBUG, False),
+    ("WARN", logging.WARNING, False),
+    ("Error", logging.ERROR, False),
+    ("not_a_level", logging.INFO, True),
+    ("", logging.INFO, True),
+    (None, logging.INFO, True)
+])
+def test_config_logging_levels(loglevel, expected_level, is_invalid, monkeypatch, tmpdir, caplog):
+    root_logger = logging.getLogger()
+    original_level = root_logger.level
+    original_handlers = list(root_logger.handlers)
+
+    monkeypatch.setattr(app, "logging_initialized", False)
+    monkeypatch.setattr(app, "LOG", None, raising=False)
+    monkeypatch.setattr(app, "LOG_PATH", None, raising=False)
+    monkeypatch.setattr(logging, "raiseExceptions", logging.raiseExceptions)
+
+    mock_app = app.App.__new__(app.App)
+    mock_app.opts = {}
+    mock_app._log_listener = None
+
+    try:
+        with patch("resilient_circuits.app.atexit"), patch("resilient_circuits.app.Debugger"):
+            mock_app.config_logging(str(tmpdir), loglevel, "app.log")
+
+        assert root_logger.level == expected_level
+        assert ("Invalid logging level specified" in caplog.text) == is_invalid
+    finally:
+        mock_app._stop_log_listener()
+        for handler in root_logger.handlers:
+            if handler not in original_handlers:
+                root_logger.removeHandler(handler)
+                handler.close()
+        root_logger.setLevel(original_level)
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason="QueueListener is not available in PY2.7")
+def test_stop_log_listener_restores_handlers():
+    from logging.handlers import QueueHandler, QueueListener
+
+    root_logger = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    mock_handler = logging.NullHandler()
+
+    mock_app = app.App.__new__(app.App)
+    mock_app._log_queue_handler = QueueHandler(log_queue)
+    mock_app._log_handlers = [mock_handler]
+    mock_app._log_listener = QueueListener(log_queue, mock_handler)
+    mock_app._log_listener.start()
+    root_logger.addHandler(mock_app._log_queue_handler)
+    queue_handler = mock_app._log_queue_handler
+
+    try:
+        mock_app._stop_log_listener()
+
+        assert mock_app._log_listener is None
+        assert queue_handler not in root_logger.handlers
+        assert mock_handler in root_logger.handlers
+
+        # a second stop (e.g. from atexit) does nothing
+        mock_app._stop_log_listener()
+        assert root_logger.handlers.count(mock_handler) == 1
+    finally:
+        root_logger.removeHandler(queue_handler)
+        root_logger.removeHandler(mock_handler)
+
+
+@pytest.mark.skipif(sys.version_info.major < 3, reason="QueueListener is not available in PY2.7")
+def test_app_restartable_stopped_restores_handlers():
+    from logging.handlers import QueueHandler, QueueListener
+
+    root_logger = logging.getLogger()
+    log_queue = queue.Queue(-1)
+    mock_handler = logging.NullHandler()
+
+    mock_app = app_restartable.AppRestartable.__new__(app_restartable.AppRestartable)
+    mock_app.observer = None
+    mock_app._log_queue_handler = QueueHandler(log_queue)
+    mock_app._log_handlers = [mock_handler]
+    mock_app._log_listener = QueueListener(log_queue, mock_handler)
+    mock_app._log_listener.start()
+    root_logger.addHandler(mock_app._log_queue_handler)
+    queue_handler = mock_app._log_queue_handler
+
+    try:
+        mock_app.stopped(mock_app)
+
+        assert mock_app._log_listener is None
+        assert queue_handler not in root_logger.handlers
+        assert mock_handler in root_logger.handlers
+    finally:
+        root_logger.removeHandler(queue_handler)
+        root_logger.removeHandler(mock_handler)
+
+
+def test_start_component_loader_only_once():
+    mock_app = app.App.__new__(app.App)
+    mock_app.auto_load_components = True
+    mock_app.component_loader = None
+    mock_app._component_loader_thread = None
+
+    with patch("resilient_circuits.app.threading.Thread") as mock_thread:
+        # e.g. 'started' then 'registered' before the loader thread has created the ComponentLoader
+        mock_app._start_component_loader()
+        mock_app._start_component_loader()
+
+        assert mock_thread.call_count == 1
+        mock_thread.return_value.start.assert_called_once_with()
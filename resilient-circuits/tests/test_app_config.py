@@ -3,8 +3,11 @@
 # (c) Copyright IBM Corp. 2010, 2020. All Rights Reserved.
 
 import copy
+import os
+import shutil
 import sys
 import pytest
+from resilient_circuits import app_argument_parser
 from resilient_circuits.app import AppArgumentParser
 from resilient_circuits.validate_configs import MAX_NUM_WORKERS
 from tests.shared_mock_data import mock_paths
@@ -46,3 +49,46 @@ def test_global_integrations_options_commented_out(fx_clear_cmd_line_args):
     assert opts.get("http_proxy") is None
     assert opts.get("https_proxy") is None
     assert opts.get("timeout") is None
+
+
+def test_config_file_is_cached(fx_clear_cmd_line_args):
+    parser_one = AppArgumentParser(config_file=mock_paths.MOCK_APP_CONFIG)
+    parser_two = AppArgumentParser(config_file=mock_paths.MOCK_APP_CONFIG)
+    assert parser_one.config is parser_two.config
+    assert parser_two.parse_args().get("num_workers") == 5
+
+
+def test_config_file_cache_invalidated_on_change(fx_clear_cmd_line_args, tmpdir):
+    path_config = os.path.join(str(tmpdir), "app.config")
+    shutil.copy(mock_paths.MOCK_APP_CONFIG, path_config)
+
+    parser_one = AppArgumentParser(config_file=path_config)
+    assert parser_one.parse_args().get("num_workers") == 5
+
+    with open(path_config, "a") as f:
+        f.write("\n[new_section]\nnew_opt = new_value\n")
+
+    parser_two = AppArgumentParser(config_file=path_config)
+    assert parser_one.config is not parser_two.config
+    assert parser_two.parse_args().get("new_section", {}).get("new_opt") == "new_value"
+
+    # Only the latest parsed config is kept for the path
+    cached_config = app_argument_parser._CONFIG_CACHE[os.path.abspath(path_config)][1]
+    assert cached_config is parser_two.config
+
+
+def test_is_true():
+    for value in ("1", "true", "True", "TRUE", "yes", "Y", "t"):
+        assert AppArgumentParser._is_true(value) is True
+    for value in ("0", "false", "False", "no", "N", "", None):
+        assert not AppArgumentParser._is_true(value)
+
+
+def test_enable_syslog(fx_clear_cmd_line_args):
+    # Off by default
+    opts = AppArgumentParser(config_file=mock_paths.MOCK_APP_CONFIG).parse_args()
+    assert opts.get("enable_syslog") is False
+
+    sys.argv.append("--enable-syslog")
+    opts = AppArgumentParser(config_file=mock_paths.MOCK_APP_CONFIG).parse_args()
+    assert opts.get("enable_syslog") is True
@@ -362,6 +362,16 @@ class CmdValidate(BaseCmd):
 
         attributes = validation_configurations.setup_py_attributes
 
+        # parse setup.py once per parse_func for all the attributes it handles,
+        # rather than re-reading and re-evaluating the file for every attribute
+        parse_funcs = {}
+        for attr in attributes:
+            parse_funcs.setdefault(attributes.get(attr).get("parse_func"), []).append(attr)
+
+        parsed_attrs = {}
+        for parse_func, attr_names in parse_funcs.items():
+            parsed_attrs.update(parse_func(path_setup_py_file, attr_names))
+
         # check through setup.py file parse
         for attr in attributes:
             attr_dict = attributes.get(attr)
@@ -373,8 +383,8 @@ class CmdValidate(BaseCmd):
             missing_msg = attr_dict.get("missing_msg")
             solution = attr_dict.get("solution")
 
-            # run given parsing function
-            parsed_attr = attr_dict.get("parse_func")(path_setup_py_file, [attr]).get(attr)
+            # get the value parsed for this attr
+            parsed_attr = parsed_attrs.get(attr)
 
             # check if attr is missing from setup.py file
             if not parsed_attr:
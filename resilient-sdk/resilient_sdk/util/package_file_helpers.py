@@ -256,6 +256,19 @@ def get_dependency_from_install_requires(install_requires, dependency_name):
     return dependency
 
 
+def has_any_dependency(install_requires, dependency_names):
+    """Returns True if any of the dependency_names is found in the install_requires
+    list parsed from the setup.py file with utils.parse_setup_py().
+    Makes a single pass over install_requires, using the same matching
+    as get_dependency_from_install_requires()
+
+    - install_requires: List  "['resilient-circuits>=31.0.0', 'resilient_lib']"
+    - dependency_names: Set {"resilient_circuits", "resilient-circuits"}
+    - Return: True
+    """
+    return any(name in d for d in install_requires for name in dependency_names)
+
+
 def load_customize_py_module(path_customize_py, warn=True):
     """
     Return the path_customize_file as a Python Module.
@@ -982,19 +995,16 @@ def get_required_python_version(python_requires_str):
 
 def check_package_installed(package_name):
     """
-    Uses pkg_resources.require to certify that a package is installed
+    Uses sdk_helpers.get_package_version to certify that a package is installed.
+    That reads the package's own metadata (and caches the result) rather than
+    resolving all of its requirements with pkg_resources.require
     
     :param package_name: name of package
     :type package_name: str
     :return: boolean value whether or not package is installed in current python env
     :rtype: bool
     """
-    try:
-        pkg_resources.require(package_name)
-    except pkg_resources.DistributionNotFound:
-        return False
-
-    return True
+    return sdk_helpers.get_package_version(package_name) is not None
 
 def color_output(s, level, do_print=False):
     """
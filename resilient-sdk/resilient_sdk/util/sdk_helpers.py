@@ -14,7 +14,6 @@ import json
 import datetime
 import importlib
 import hashlib
-import time
 import uuid
 import shlex
 import subprocess
@@ -42,11 +41,23 @@ else:
     reload = importlib.reload
     from json.decoder import JSONDecodeError
 
+try:
+    # importlib.metadata is only available in PY3.8+
+    from importlib import metadata as importlib_metadata
+except ImportError:
+    importlib_metadata = None
+
 # Temp fix to handle the resilient module logs
 logging.getLogger("resilient.co3").addHandler(logging.StreamHandler())
 # Get the same logger object that is used in app.py
 LOG = logging.getLogger(constants.LOGGER_NAME)
 
+# package_name -> parsed installed version, see get_package_version()
+_PACKAGE_VERSION_CACHE = {}
+
+# relative_path_to_template -> Jinja2 Environment, see setup_env_and_render_jinja_file()
+_JINJA_ENV_CACHE = {}
+
 
 def get_resilient_client(path_config_file=None):
     """
@@ -92,10 +103,15 @@ def setup_env_and_render_jinja_file(relative_path_to_template, filename, *args,
     """
     Creates a Jinja env and returns the rendered string from a jinja template of a given filename.
     Passes on args and kwargs to the render function
+
+    The env is created once for each relative_path_to_template and reused, so
+    its compiled templates are cached between calls
     """
 
     # instantiate Jinja2 Environment with path to Jinja2 templates
-    jinja_env = setup_jinja_env(relative_path_to_template)
+    jinja_env = _JINJA_ENV_CACHE.get(relative_path_to_template)
+    if jinja_env is None:
+        jinja_env = _JINJA_ENV_CACHE[relative_path_to_template] = setup_jinja_env(relative_path_to_template)
 
     # Load the Jinja2 Template from filename + jinja2 ext
     file_template = jinja_env.get_template(filename + ".jinja2")
@@ -830,7 +846,7 @@ def minify_export(export,
         elif key in keys_to_minify.keys():
 
             # Get the attribute_name to match on (normally 'name'/'programmatic_name'/'export_key')
-            attribute_name = list(keys_to_minify[key].keys())[0]
+            attribute_name = next(iter(keys_to_minify[key]))
 
             values = keys_to_minify[key][attribute_name]
             # strip out extra spaces from the attribute (ie Display name for Rules, Scripts, etc.)
@@ -1136,11 +1152,44 @@ def get_package_version(package_name):
     Uses pkg_resources to parse the version of a package if installed in the environment.
     If not installed, return None
 
+    Found versions are cached for each package_name. A package that is not
+    found is not cached, so it is picked up if it gets installed later
+
+    :param package_name: name of the packge to get version of
+    :type package_name: str
+    :return: a Version object representing the version of the given package or None
+    :rtype: Version or None
+    """
+    package_version = _PACKAGE_VERSION_CACHE.get(package_name)
+
+    if package_version is None:
+        package_version = _read_package_version(package_name)
+
+        if package_version is not None:
+            _PACKAGE_VERSION_CACHE[package_name] = package_version
+
+    return package_version
+
+
+def _read_package_version(package_name):
+    """
+    Read and parse the installed version of package_name or return None if not installed.
+
+    On PY3.8+ the installed version is read with importlib.metadata, which only
+    looks at the package's own metadata instead of resolving its requirements
+    like pkg_resources.require does
+
     :param package_name: name of the packge to get version of
     :type package_name: str
     :return: a Version object representing the version of the given package or None
     :rtype: Version or None
     """
+    if importlib_metadata:
+        try:
+            return pkg_resources.parse_version(importlib_metadata.version(package_name))
+        except importlib_metadata.PackageNotFoundError:
+            return None
+
     try:
         return pkg_resources.parse_version(pkg_resources.require(package_name)[0].version)
     except pkg_resources.DistributionNotFound:
@@ -1274,15 +1323,18 @@ def run_subprocess(args, change_dir=None, cmd_name="", log_level_threshold=loggi
     # using LOG.log(log_level...)
     if LOG.isEnabledFor(log_level_threshold):
         LOG.debug("")
-        details = ""
+        details_lines = []
         while proc.stdout:
             line = proc.stdout.readline()
             if not line:
                 break
-            LOG.log(log_level_threshold, line.decode("utf-8").strip("\n"))
-            details += line.decode("utf-8")
+            # decode each line once and use it for both the log and the details
+            line = line.decode("utf-8")
+            LOG.log(log_level_threshold, line.strip("\n"))
+            details_lines.append(line)
 
         proc.wait() # additional wait to make sure process is complete
+        details = u"".join(details_lines)
     else:
         # if debugging not enabled, use communicate as that has the
         # greatest ability to deal with large buffers of output 
@@ -1290,7 +1342,6 @@ def run_subprocess(args, change_dir=None, cmd_name="", log_level_threshold=loggi
         stdout, _ = proc.communicate()
         sys.stdout.write(" {0} complete\n\n".format(cmd_name))
         sys.stdout.flush()
-        time.sleep(0.75)
         details = stdout.decode("utf-8")
 
 
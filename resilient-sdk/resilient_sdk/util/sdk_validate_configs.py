@@ -9,11 +9,22 @@ from resilient_sdk.util import package_file_helpers as package_helpers
 from resilient_sdk.util import sdk_helpers, sdk_validate_helpers
 from resilient_sdk.util.sdk_validate_issue import SDKValidateIssue
 
+# regexes used by the setup.py fail_funcs are compiled once at import.
+# Their bound .search methods are used directly as fail_funcs: a match
+# (truthy) means the attribute fails the check
+_RE_INVALID_NAME = re.compile(r"[^a-z_0-9]+")
+_RE_PLACEHOLDER = re.compile(r"^<<|>>$")
+_RE_EXAMPLE_EMAIL = re.compile(r"@example\.com")
+_RE_DEFAULT_DESC = re.compile(r"^(Resilient Circuits Components).*")
+
+_SUPPORTED_EP_SET = frozenset(package_helpers.SUPPORTED_EP)
+_RC_NAMES = frozenset({"resilient_circuits", "resilient-circuits"})
+
 # formatted strings follow array of values: [attr, attr_value, <OPTIONAL: fail_msg_lambda_supplement>]
 setup_py_attributes = {
     "name": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"[^a-z_0-9]+", x),
+        "fail_func": _RE_INVALID_NAME.search,
         "fail_msg": u"setup.py attribute '{0}' has invalid character(s) in '{1}'",
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Make sure that '{0}' is all lowercase and contains only letters, numbers or underscores",
@@ -21,7 +32,7 @@ setup_py_attributes = {
     },
     "display_name": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"^<<|>>$", x),
+        "fail_func": _RE_PLACEHOLDER.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1}'", 
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Set '{0}' to an appropriate value. This value is displayed when the app is installed",
@@ -29,7 +40,7 @@ setup_py_attributes = {
     },
     "license": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"^<<|>>$", x),
+        "fail_func": _RE_PLACEHOLDER.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1}'", 
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Set '{0}' to an valid license.",
@@ -45,7 +56,7 @@ setup_py_attributes = {
     },
     "author": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"^<<|>>$", x),
+        "fail_func": _RE_PLACEHOLDER.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1}'", 
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Set '{0}' to the name of the author",
@@ -53,7 +64,7 @@ setup_py_attributes = {
     },
     "author_email": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"@example\.com", x),
+        "fail_func": _RE_EXAMPLE_EMAIL.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1}'", 
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Set '{0}' to the author's contact email",
@@ -61,7 +72,7 @@ setup_py_attributes = {
     },
     "description": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"^(Resilient Circuits Components).*", x),
+        "fail_func": _RE_DEFAULT_DESC.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1:29.29}...'", 
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Enter text that describes the app in '{0}'. This will be displayed when the app is installed",
@@ -69,7 +80,7 @@ setup_py_attributes = {
     },
     "long_description": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: re.findall(r"^(Resilient Circuits Components).*", x),
+        "fail_func": _RE_DEFAULT_DESC.search,
         "fail_msg": u"setup.py attribute '{0}' remains unchanged from the default value '{1:29.29}...'",
         "missing_msg": u"setup.py file is missing attribute '{0}' or missing the value for the attribute",
         "solution": u"Enter text that describes the app in '{0}'. This will be displayed when the app is installed",
@@ -77,10 +88,7 @@ setup_py_attributes = {
     },
     "install_requires": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: False 
-            if package_helpers.get_dependency_from_install_requires(x, "resilient_circuits") is not None 
-            else False if package_helpers.get_dependency_from_install_requires(x, "resilient-circuits") is not None
-            else True,
+        "fail_func": lambda x: not package_helpers.has_any_dependency(x, _RC_NAMES),
         "fail_msg": u"'resilient_circuits' must be included as a dependency in '{0}'. Found '{1}'",
         "missing_msg": u"'resilient_circuits' must be included as a dependency in '{0}'",
         "solution": u"Include 'resilient_circuits>={0}' as a requirement in '{1}'".format(
@@ -102,9 +110,9 @@ setup_py_attributes = {
     },
     "entry_points": {
         "parse_func": package_helpers.parse_setup_py,
-        "fail_func": lambda x: False if not any([ep not in x for ep in package_helpers.SUPPORTED_EP]) else True,
+        "fail_func": lambda x, s=_SUPPORTED_EP_SET: not s.issubset(x),
         "fail_msg": u"'{0}' is missing {2} which is one of the required entry points", 
-        "fail_msg_lambda_supplement": lambda x: [ep for ep in package_helpers.SUPPORTED_EP if ep not in x],
+        "fail_msg_lambda_supplement": lambda x, s=_SUPPORTED_EP_SET: sorted(s.difference(x)),
         "missing_msg": u"'{0}' is missing",
         "solution": "Make sure that all of the following values for '{0}' are implemented: " + str(package_helpers.SUPPORTED_EP),
         "severity": SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
@@ -35,6 +35,12 @@ except ImportError as err:
 # float value in range [0, 1] that determines the cutoff at which two files are a match
 MATCH_THRESHOLD = 1.0
 
+# minimum supported version of resilient-circuits, parsed once
+_MIN_RESILIENT_LIBRARIES_VERSION = pkg_resources.parse_version(constants.RESILIENT_LIBRARIES_VERSION)
+
+# output of a selftest that the developer has not implemented yet
+_SELFTEST_UNIMPLEMENTED = "'state': 'unimplemented'"
+
 def selftest_validate_resilient_circuits_installed(attr_dict, **_):
     """
     selftest.py validation helper method.
@@ -57,7 +63,7 @@ def selftest_validate_resilient_circuits_installed(attr_dict, **_):
 
     res_circuits_version = sdk_helpers.get_package_version(constants.CIRCUITS_PACKAGE_NAME)
 
-    if res_circuits_version and res_circuits_version >= pkg_resources.parse_version(constants.RESILIENT_LIBRARIES_VERSION):
+    if res_circuits_version and res_circuits_version >= _MIN_RESILIENT_LIBRARIES_VERSION:
         # installed and correct version
         return True, SDKValidateIssue(
             name=attr_dict.get("name"),
@@ -65,7 +71,7 @@ def selftest_validate_resilient_circuits_installed(attr_dict, **_):
             severity=SDKValidateIssue.SEVERITY_LEVEL_DEBUG,
             solution=""
         )
-    elif res_circuits_version and res_circuits_version < pkg_resources.parse_version(constants.RESILIENT_LIBRARIES_VERSION):
+    elif res_circuits_version and res_circuits_version < _MIN_RESILIENT_LIBRARIES_VERSION:
         # resilient-circuits installed but version not supported 
         return False, SDKValidateIssue(
             name=attr_dict.get("name"),
@@ -231,11 +237,12 @@ def selftest_run_selftestpy(attr_dict, package_name, **kwargs):
     elif returncode > 2:
         # return code is a failure of REST or STOMP connection
 
-        # parse out the ERROR line and then take the 5 lines that came before it
-        i = [i for i, line in reversed(list(enumerate(details.splitlines()))) if "ERROR" in line]
-        i = i[0] if i else 0
+        # parse out the last ERROR line and then take the 5 lines that came before it
+        # (split the details once and search back from the end, stopping at the first hit)
+        details_lines = details.splitlines()
+        i = next((i for i in range(len(details_lines) - 1, -1, -1) if "ERROR" in details_lines[i]), 0)
 
-        details_parsed = u"\n\t\t...\n\t\t" + u"\n\t\t".join(details.splitlines()[max(0, i - 5):])
+        details_parsed = u"\n\t\t...\n\t\t" + u"\n\t\t".join(details_lines[max(0, i - 5):])
 
         return False, SDKValidateIssue(
             name=attr_dict.get("name"),
@@ -255,7 +262,7 @@ def selftest_run_selftestpy(attr_dict, package_name, **kwargs):
     elif returncode == 0:
         # look to see if output has "'state': 'unimplemented'" in it -- that means that user hasn't
         # implemented selftest yet. warn that they should implement selftest
-        if details.find("'state': 'unimplemented'") != -1:
+        if _SELFTEST_UNIMPLEMENTED in details:
             return False, SDKValidateIssue(
                 name=attr_dict.get("name"),
                 description=attr_dict.get("missing_msg").format(package_name),
@@ -280,7 +287,8 @@ def package_files_manifest(package_name, path_file, filename, attr_dict, **_):
     Helper method for package files to validate that at least the templated manifests are included in MANIFEST.in.
     Creates a list of missing template manifest lines.
 
-    Does a fuzzy match of lines with cutoff=0.9 for matching between lines. More info on the matching
+    Template lines found exactly in the file match straight away, the rest fall back to
+    a fuzzy match of lines with cutoff=0.9 for matching between lines. More info on the matching
     here: https://docs.python.org/3.6/library/difflib.html#difflib.get_close_matches
 
     :param package_name: (required) the name of the package
@@ -306,12 +314,15 @@ def package_files_manifest(package_name, path_file, filename, attr_dict, **_):
     # split template file into list of lines
     template_contents = file_rendered.splitlines(True)
     
+    # lines of the given file, for an exact match before falling back to a fuzzy match
+    file_lines = set(file_contents)
+
     # compare given file to template
     diffs = []
     for line in template_contents:
-        if line.strip() == "":
+        if line.strip() == "" or line in file_lines:
             continue
-        matches = difflib.get_close_matches(line, file_contents, cutoff=0.90)
+        matches = difflib.get_close_matches(line, file_contents, n=1, cutoff=0.90)
         if not matches:
             diffs.append(str(line.strip()))
 
@@ -350,14 +361,12 @@ def package_files_apikey_pem(path_file, attr_dict, **_):
     # read package's apikey_permissions.txt file
     file_contents = sdk_helpers.read_file(path_file)
 
-    # filter out commented lines
-    file_contents = [line.strip() for line in file_contents if not line.startswith("#")]
+    # filter out commented lines (including indented ones)
+    file_contents = [line.strip() for line in file_contents if not line.lstrip().startswith("#")]
     
     # compare given file to constant BASE_PERMISSIONS
-    missing_permissions = []
-    for perm in package_helpers.BASE_PERMISSIONS:
-        if perm not in file_contents:
-            missing_permissions.append(perm)
+    permissions = set(file_contents)
+    missing_permissions = [perm for perm in package_helpers.BASE_PERMISSIONS if perm not in permissions]
 
     if missing_permissions:
         # missing the base perimissions
@@ -411,11 +420,14 @@ def package_files_template_match(package_name, package_version, path_file, filen
     template_contents = [line.strip("\n") + "\n" for line in file_rendered.splitlines()]
     
     # compare given file to template (ignoring blanks and hard tabs)
-    s_diff = difflib.SequenceMatcher(lambda x: x in " \t", file_contents, template_contents)
+    # identical files are a perfect match, so only run the SequenceMatcher when they differ
+    if file_contents == template_contents:
+        comp_ratio = 1.0
+    else:
+        comp_ratio = difflib.SequenceMatcher(lambda x: x in " \t", file_contents, template_contents).ratio()
 
     # check match between the two files
     # if less than a perfect match, the match fails
-    comp_ratio = s_diff.ratio()
     if comp_ratio < MATCH_THRESHOLD:
         diff = difflib.unified_diff(template_contents, file_contents, 
                                     fromfile=filename + " template", tofile=filename, n=0) # n is number of context lines
@@ -689,12 +701,8 @@ def package_files_validate_readme(path_package, path_file, filename, attr_dict,
     # split template file into list of lines
     template_contents = codegen_readme_rendered.splitlines(True)
     # compare given file to template from codegen
-    s_diff = difflib.SequenceMatcher(None, file_contents, template_contents)
-
-    # check match between the two files
     # if the package file matches the codegen template, fail
-    comp_ratio = s_diff.ratio()
-    if comp_ratio == MATCH_THRESHOLD:
+    if file_contents == template_contents:
         # if it matches the codegen template, we return immediately and don't run any other checks
         return [SDKValidateIssue(
             name=attr_dict.get("name"),
@@ -703,8 +711,14 @@ def package_files_validate_readme(path_package, path_file, filename, attr_dict,
             solution=attr_dict.get("fail_codegen_solution").format(path_package)
         )]
 
+    # look for the docgen placeholder string and any "TODO"'s in the whole readme at once.
+    # neither contains a newline so this finds the same matches as looking line by line
+    readme_text = u"".join(file_contents)
+    found_placeholder = u"<!-- {0} -->".format(constants.DOCGEN_PLACEHOLDER_STRING) in readme_text
+    found_todo = u"TODO" in readme_text
+
     # if placeholder string is still in the readme
-    if any("<!-- {0} -->".format(constants.DOCGEN_PLACEHOLDER_STRING) in line for line in file_contents):
+    if found_placeholder:
         issues.append(SDKValidateIssue(
             name=attr_dict.get("name"),
             description=attr_dict.get("fail_placeholder_msg").format(constants.DOCGEN_PLACEHOLDER_STRING),
@@ -713,7 +727,7 @@ def package_files_validate_readme(path_package, path_file, filename, attr_dict,
         ))
 
     # fail if there are any "TODO"'s remaining
-    if any("TODO" in line for line in file_contents):
+    if found_todo:
         issues.append(SDKValidateIssue(
             name=attr_dict.get("name"),
             description=attr_dict.get("fail_todo_msg"),
@@ -724,17 +738,23 @@ def package_files_validate_readme(path_package, path_file, filename, attr_dict,
     # check that linked screenshots are in the /docs/screenshots folder
 
     # gather list of screenshots in the readme file
+    screenshot_paths = []
+    invalid_paths = []
     try:
         screenshot_paths = package_helpers.parse_file_paths_from_readme(file_contents)
-        invalid_paths = []
     except SDKException as e:
         # if links aren't properly formatted in the readme, they won't pass
         err_msg = str(e).replace("\n", " ")
         err_msg = err_msg[err_msg.index("ERROR: ")+len("ERROR: "):]
-        issues.append([SDKValidateIssue("README.md link syntax error", err_msg)])
+        issues.append(SDKValidateIssue("README.md link syntax error", err_msg))
 
     # for each gathered path, check if the file path is valid
+    # the same screenshot is often linked more than once, so only check each path once
+    checked_paths = set()
     for path in screenshot_paths:
+        if path in checked_paths:
+            continue
+        checked_paths.add(path)
         try:
             sdk_helpers.validate_file_paths(os.R_OK, os.path.join(path_package, path))
         except SDKException:
@@ -1247,7 +1267,7 @@ def _tox_tests_parse_xml_report(path_xml_file):
     :rtype: (int, int, int, str, str)
     """
 
-    num_tests, num_failures, num_errors, failure_str, error_str = 0, 0, 0, "", ""
+    num_tests, num_failures, num_errors, failure_strs, error_strs = 0, 0, 0, [], []
 
     tree = ET.parse(path_xml_file)
     root = tree.getroot()
@@ -1266,9 +1286,9 @@ def _tox_tests_parse_xml_report(path_xml_file):
             for case in suite:
                 for elem in case:
                     if elem.tag == "failure":
-                        failure_str += u"{0}\n\n---\n\n".format(elem.text)
+                        failure_strs.append(u"{0}\n\n---\n\n".format(elem.text))
                     elif elem.tag == "error":
-                        error_str += u"{0}: {1}\n".format(case.attrib.get("classname"), elem.attrib.get("message"))
+                        error_strs.append(u"{0}: {1}\n".format(case.attrib.get("classname"), elem.attrib.get("message")))
     else:
         # if the root wasn't test suites 
         LOG.warn("WARNING: XML report generated by tox run was not readable. Consider upgrading tox and pytest to the latest versions")
@@ -1276,7 +1296,7 @@ def _tox_tests_parse_xml_report(path_xml_file):
 
 
 
-    return num_tests, num_failures, num_errors, error_str, failure_str
+    return num_tests, num_failures, num_errors, u"".join(error_strs), u"".join(failure_strs)
 
 
 
@@ -19,10 +19,11 @@ import logging
 import os
 import shutil
 import sys
+import tempfile
 
 import pytest
 import resilient_sdk.app as app
-from resilient_sdk.util import constants, sdk_helpers
+from resilient_sdk.util import constants, sdk_helpers, sdk_validate_configs
 from resilient_sdk.util import package_file_helpers as package_helpers
 
 from tests.shared_mock_data import mock_paths
@@ -89,6 +90,9 @@ def _pip_install(package):
     install_cmd = ["pip", "install", package]
     sdk_helpers.run_subprocess(install_cmd)
 
+    # installed versions may have changed
+    sdk_helpers._PACKAGE_VERSION_CACHE.clear()
+
 def _pip_uninstall(package):
     """
     pip uninstalls package
@@ -96,6 +100,9 @@ def _pip_uninstall(package):
     unisntall_cmd = ["pip", "uninstall", "-y", package]
     sdk_helpers.run_subprocess(unisntall_cmd)
 
+    # installed versions may have changed
+    sdk_helpers._PACKAGE_VERSION_CACHE.clear()
+
 
 @pytest.fixture(scope="session")
 def fx_mock_res_client():
@@ -110,6 +117,19 @@ def fx_mock_res_client():
     _rm_temp_dir()
 
 
+@pytest.fixture(scope="session")
+def fx_org_export(fx_mock_res_client):
+    """
+    Before: Gets the latest org export once for the whole test session
+    After: Nothing
+    Note: this export is shared by every test that uses it. get_from_export
+    and minify_export deepcopy it, so it can be passed to them as is. Anything
+    else that may change it (e.g. get_res_obj, which adds 'x_api_name' to
+    the objects it returns) must be given a copy.deepcopy of it
+    """
+    return sdk_helpers.get_latest_org_export(fx_mock_res_client)
+
+
 @pytest.fixture
 def fx_mk_temp_dir():
     """
@@ -145,6 +165,43 @@ def fx_copy_fn_main_mock_integration():
     _rm_temp_dir()
 
 
+@pytest.fixture(scope="session")
+def fx_copy_fn_main_mock_integration_session():
+    """
+    Before: Creates a new temp dir (outside of mock_paths.TEST_TEMP_DIR) and copies
+            fn_main_mock_integration to it once for the whole test session
+    Returns a tuple (mock_paths.MOCK_INT_FN_MAIN_MOCK_INTEGRATION_NAME, path_fn_main_mock_integration)
+    After: Removes the temp directory
+    Note: ONLY use for tests that do not change the package's files,
+    else use fx_copy_fn_main_mock_integration
+    """
+    path_temp_dir = tempfile.mkdtemp()
+    path_fn_main_mock_integration = os.path.join(path_temp_dir, mock_paths.MOCK_INT_FN_MAIN_MOCK_INTEGRATION_NAME)
+    shutil.copytree(mock_paths.MOCK_INT_FN_MAIN_MOCK_INTEGRATION, path_fn_main_mock_integration)
+    yield (mock_paths.MOCK_INT_FN_MAIN_MOCK_INTEGRATION_NAME, path_fn_main_mock_integration)
+    shutil.rmtree(path_temp_dir)
+
+
+@pytest.fixture(scope="session")
+def fx_package_file_paths(fx_copy_fn_main_mock_integration_session):
+    """
+    Before: Builds a dict of each filename in sdk_validate_configs.package_files
+            to its path in the session copy of fn_main_mock_integration,
+            the same way cmds.validate._validate_package_files does
+    After: Nothing
+    """
+    package_name, path_package = fx_copy_fn_main_mock_integration_session
+    file_paths = {}
+
+    for filename, attr_dict in sdk_validate_configs.package_files.items():
+        if attr_dict.get("path"):
+            file_paths[filename] = os.path.join(path_package, attr_dict.get("path").format(package_name))
+        else:
+            file_paths[filename] = os.path.join(path_package, filename)
+
+    return file_paths
+
+
 @pytest.fixture
 def fx_copy_fn_main_mock_integration_w_playbooks():
     """
@@ -69,6 +69,15 @@ def test_get_dependency_from_install_requires():
     assert res_circuits_dep_str == "resilient_circuits>=30.0.0"
 
 
+def test_has_any_dependency():
+    install_requires = ["resilient-circuits>=30.0.0", "resilient_lib"]
+
+    assert package_helpers.has_any_dependency(install_requires, {"resilient_circuits", "resilient-circuits"})
+    assert package_helpers.has_any_dependency(install_requires, {"resilient_lib"})
+    assert not package_helpers.has_any_dependency(install_requires, {"resilient_sdk"})
+    assert not package_helpers.has_any_dependency([], {"resilient_circuits"})
+
+
 def test_load_customize_py_module(fx_mk_temp_dir):
     path_customize_py = os.path.join(mock_paths.TEST_TEMP_DIR, "customize.py")
     shutil.copy(mock_paths.MOCK_CUSTOMIZE_PY, path_customize_py)
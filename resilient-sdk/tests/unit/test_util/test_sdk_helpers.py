@@ -2,6 +2,7 @@
 # -*- coding: utf-8 -*-
 # (c) Copyright IBM Corp. 2010, 2020. All Rights Reserved.
 
+import copy
 import os
 import re
 import stat
@@ -18,6 +19,19 @@ from resilient_sdk.util.resilient_objects import ResilientObjMap
 from resilient_sdk.util.sdk_exception import SDKException
 from tests.shared_mock_data import mock_data, mock_paths
 
+_BAK_RE = re.compile(r'^mock_file\.txt-\d+\d+\d+\d+\d+\d+\d+\.bak$')
+_TS_RE = re.compile(r"\d\d\d\d\d\d\d\d\d\d\d\d\d\d")
+_MOCK_FUNCTION_NAMES = frozenset(["mock_function_one", "mock_function_two"])
+
+_MOCK_FILE = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+_MOCK_RENAMED_FILE = os.path.join(mock_paths.TEST_TEMP_DIR, "new_file_name.txt")
+_MOCK_PERMISSIONS_FILE = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_permissions.txt")
+_MOCK_EXISTING_FILE = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_existing_file.txt")
+
+
+def _is_mock_function_one(obj):
+    return obj.get("export_key") == "mock_function_one"
+
 
 def test_get_resilient_client(fx_mk_temp_dir, fx_mk_app_config, caplog):
     res_client = sdk_helpers.get_resilient_client(path_config_file=fx_mk_app_config)
@@ -31,8 +45,19 @@ def test_setup_jinja_env(fx_mk_temp_dir):
     assert jinja_env.loader.package_path == mock_paths.TEST_TEMP_DIR
 
 
+def test_setup_env_and_render_jinja_file_reuses_env():
+    first = sdk_helpers.setup_env_and_render_jinja_file(constants.PACKAGE_TEMPLATE_PATH, "MANIFEST.in", package_name="fn_mock")
+
+    with patch("resilient_sdk.util.sdk_helpers.setup_jinja_env") as mock_setup_jinja_env:
+        second = sdk_helpers.setup_env_and_render_jinja_file(constants.PACKAGE_TEMPLATE_PATH, "MANIFEST.in", package_name="fn_mock")
+        mock_setup_jinja_env.assert_not_called()
+
+    assert first == second
+    assert "fn_mock" in first
+
+
 def test_read_write_file(fx_mk_temp_dir):
-    temp_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+    temp_file = _MOCK_FILE
     sdk_helpers.write_file(temp_file, mock_data.mock_file_contents)
     assert os.path.isfile(temp_file)
 
@@ -47,7 +72,7 @@ def test_read_json_file_success():
 
 
 def test_read_json_file_fail(fx_mk_temp_dir):
-    temp_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+    temp_file = _MOCK_FILE
     sdk_helpers.write_file(temp_file, mock_data.mock_file_contents)
     match_text = "Could not read corrupt JSON file at {0}".format(temp_file)
 
@@ -56,11 +81,11 @@ def test_read_json_file_fail(fx_mk_temp_dir):
 
 
 def test_rename_file(fx_mk_temp_dir):
-    temp_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+    temp_file = _MOCK_FILE
     sdk_helpers.write_file(temp_file, mock_data.mock_file_contents)
 
     sdk_helpers.rename_file(temp_file, "new_file_name.txt")
-    path_renamed_file = os.path.join(mock_paths.TEST_TEMP_DIR, "new_file_name.txt")
+    path_renamed_file = _MOCK_RENAMED_FILE
 
     assert os.path.isfile(path_renamed_file) is True
 
@@ -119,7 +144,7 @@ def test_generate_uuid_from_string():
 
 
 def test_has_permissions(fx_mk_temp_dir):
-    temp_permissions_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_permissions.txt")
+    temp_permissions_file = _MOCK_PERMISSIONS_FILE
     sdk_helpers.write_file(temp_permissions_file, mock_data.mock_file_contents)
 
     # Set permissions to Read only
@@ -140,7 +165,7 @@ def test_validate_file_paths(fx_mk_temp_dir):
     with pytest.raises(SDKException, match=r"Could not find file: " + non_exist_file):
         sdk_helpers.validate_file_paths(None, non_exist_file)
 
-    exists_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_existing_file.txt")
+    exists_file = _MOCK_EXISTING_FILE
     sdk_helpers.write_file(exists_file, mock_data.mock_file_contents)
 
     sdk_helpers.validate_file_paths(None, exists_file)
@@ -192,19 +217,18 @@ def test_get_obj_from_list():
     assert "mock_function_two" in got_functions
 
     # Test lambda condition
-    got_functions = sdk_helpers.get_obj_from_list("export_key", all_functions, lambda o: True if o.get("export_key") == "mock_function_one" else False)
+    got_functions = sdk_helpers.get_obj_from_list("export_key", all_functions, _is_mock_function_one)
     assert "mock_function_one" in got_functions
     assert "mock_function_two" not in got_functions
 
 
-def test_get_object_api_names(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-    export_data = sdk_helpers.get_from_export(org_export,
+def test_get_object_api_names(fx_org_export):
+    export_data = sdk_helpers.get_from_export(fx_org_export,
                                               functions=["mock_function_one", "mock_function_two"])
 
     func_api_names = sdk_helpers.get_object_api_names("x_api_name", export_data.get("functions"))
 
-    assert all(elem in ["mock_function_one", "mock_function_two"] for elem in func_api_names) is True
+    assert _MOCK_FUNCTION_NAMES.issuperset(func_api_names) is True
 
 
 def test_get_res_obj():
@@ -213,7 +237,7 @@ def test_get_res_obj():
     artifacts_wanted = ["mock_artifact_2", "mock_artifact_type_one"]
     artifacts = sdk_helpers.get_res_obj("incident_artifact_types", "programmatic_name", "Custom Artifact", artifacts_wanted, org_export)
 
-    assert all(elem.get("x_api_name") in artifacts_wanted for elem in artifacts) is True
+    assert set(artifacts_wanted).issuperset(elem.get("x_api_name") for elem in artifacts) is True
 
 def test_get_incident_types():
     org_export = sdk_helpers.read_json_file(mock_paths.MOCK_EXPORT_RES)
@@ -221,7 +245,7 @@ def test_get_incident_types():
     incident_types_wanted = [u"mock_incidenttype_Āā", u"mock incident type one"]
     incident_types = sdk_helpers.get_res_obj("incident_types", "name", "Custom Incident Types", incident_types_wanted, org_export)
 
-    assert all(elem.get("name") in incident_types_wanted for elem in incident_types) is True
+    assert set(incident_types_wanted).issuperset(elem.get("name") for elem in incident_types) is True
 
 def test_get_res_obj_corrupt_export():
     org_export = sdk_helpers.read_json_file(mock_paths.MOCK_EXPORT_RES_CORRUPT)
@@ -232,30 +256,26 @@ def test_get_res_obj_corrupt_export():
         sdk_helpers.get_res_obj("incident_artifact_types", "programmatic_name", "Custom Artifact", artifacts_wanted, org_export)
 
 
-def test_get_res_obj_dict_in_wanted_list(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-
+def test_get_res_obj_dict_in_wanted_list(fx_org_export):
     wfs_wanted = [{"identifier": "name", "value": u"mock workflow  ล ฦ ว ศ ษ ส ห ฬ อ two"}]
-    wfs = sdk_helpers.get_res_obj("workflows", "programmatic_name", "Workflow", wfs_wanted, org_export)
+    # get_res_obj adds x_api_name to the export's objects, so give it a copy
+    wfs = sdk_helpers.get_res_obj("workflows", "programmatic_name", "Workflow", wfs_wanted, copy.deepcopy(fx_org_export))
 
     assert len(wfs) == 1
     assert wfs[0].get("programmatic_name") == "mock_workflow_two"
 
 
-def test_get_res_obj_exception(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-
+def test_get_res_obj_exception(fx_org_export):
     functions_wanted = ["mock_function_one", "fn_does_not_exist"]
 
     with pytest.raises(SDKException, match=r"Mock Display Name: 'fn_does_not_exist' not found in this export"):
-        sdk_helpers.get_res_obj("functions", "export_key", "Mock Display Name", functions_wanted, org_export)
+        sdk_helpers.get_res_obj("functions", "export_key", "Mock Display Name", functions_wanted, copy.deepcopy(fx_org_export))
 
 
-def test_get_message_destination_from_export(fx_mock_res_client):
+def test_get_message_destination_from_export(fx_org_export):
     # TODO: Add test for all resilient objects...
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
 
-    export_data = sdk_helpers.get_from_export(org_export,
+    export_data = sdk_helpers.get_from_export(fx_org_export,
                                               message_destinations=["fn_main_mock_integration"])
 
     assert export_data.get("message_destinations")[0].get("name") == "fn_main_mock_integration"
@@ -283,11 +303,9 @@ def test_get_playbooks_from_export_incompatible_version(fx_mock_res_client):
 
 @pytest.mark.parametrize("get_related_param",
                          [(True), (False)])
-def test_get_related_objects_when_getting_from_export(fx_mock_res_client, get_related_param):
+def test_get_related_objects_when_getting_from_export(fx_org_export, get_related_param):
 
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-
-    export_data = sdk_helpers.get_from_export(org_export,
+    export_data = sdk_helpers.get_from_export(fx_org_export,
                                               message_destinations=["fn_main_mock_integration"],
                                               functions=["mock_function__three"],
                                               get_related_objects=get_related_param)
@@ -296,16 +314,14 @@ def test_get_related_objects_when_getting_from_export(fx_mock_res_client, get_re
 
     if get_related_param:
         assert len(export_data.get("functions", [])) > 0
-        assert any(elem.get("name") in ("mock_function_one", "mock_function_two") for elem in export_data.get("functions")) is True
+        assert any(elem.get("name") in _MOCK_FUNCTION_NAMES for elem in export_data.get("functions")) is True
 
     else:
-        assert all(elem.get("name") in ("mock_function_one", "mock_function_two") for elem in export_data.get("functions")) is False
+        assert all(elem.get("name") in _MOCK_FUNCTION_NAMES for elem in export_data.get("functions")) is False
 
 
-def test_minify_export(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-
-    minifed_export = sdk_helpers.minify_export(org_export, functions=["mock_function_one"], phases=["Mock Custom Phase One"], scripts=["Mock Incident Script"])
+def test_minify_export(fx_org_export):
+    minifed_export = sdk_helpers.minify_export(fx_org_export, functions=["mock_function_one"], phases=["Mock Custom Phase One"], scripts=["Mock Incident Script"])
     minified_functions = minifed_export.get("functions")
     minified_fields = minifed_export.get("fields")
     minified_incident_types = minifed_export.get("incident_types")
@@ -319,6 +335,12 @@ def test_minify_export(fx_mock_res_client):
     # Test it set a non-mentioned object to 'empty'
     assert minifed_export.get("roles") == []
 
+    # Test it kept the default keys
+    assert "export_date" in minifed_export
+    assert "export_format_version" in minifed_export
+    assert "id" in minifed_export
+    assert "server_version" in minifed_export
+
     # Test phases + scripts
     assert minified_phases[0].get(ResilientObjMap.PHASES) == "Mock Custom Phase One"
     assert minified_scripts[0].get(ResilientObjMap.SCRIPTS) == "Mock Incident Script"
@@ -334,20 +356,8 @@ def test_minify_export(fx_mock_res_client):
     assert minified_incident_types[0].get("uuid") == "bfeec2d4-3770-11e8-ad39-4a0004044aa0"
 
 
-def test_minify_export_default_keys_to_keep(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-
-    minifed_export = sdk_helpers.minify_export(org_export)
-
-    assert "export_date" in minifed_export
-    assert "export_format_version" in minifed_export
-    assert "id" in minifed_export
-    assert "server_version" in minifed_export
-
-
-def test_minify_export_with_playbooks(fx_mock_res_client):
-    org_export = sdk_helpers.get_latest_org_export(fx_mock_res_client)
-    minifed_export = sdk_helpers.minify_export(org_export)
+def test_minify_export_default_keys_to_keep(fx_org_export):
+    minifed_export = sdk_helpers.minify_export(fx_org_export)
 
     assert "export_date" in minifed_export
     assert "export_format_version" in minifed_export
@@ -364,20 +374,19 @@ def test_load_by_module():
 
 
 def test_rename_to_bak_file(fx_mk_temp_dir):
-    temp_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+    temp_file = _MOCK_FILE
     sdk_helpers.write_file(temp_file, mock_data.mock_file_contents)
 
     sdk_helpers.rename_to_bak_file(temp_file)
 
     files_in_dir = os.listdir(mock_paths.TEST_TEMP_DIR)
-    regex = re.compile(r'^mock_file\.txt-\d+\d+\d+\d+\d+\d+\d+\.bak$')
-    matched_file_name = list(filter(regex.match, files_in_dir))[0]
+    matched_file_name = next(f for f in files_in_dir if _BAK_RE.match(f))
 
-    assert regex.match(matched_file_name)
+    assert _BAK_RE.match(matched_file_name)
 
 
 def test_rename_to_bak_file_if_file_not_exist(fx_mk_temp_dir):
-    temp_file = os.path.join(mock_paths.TEST_TEMP_DIR, "mock_file.txt")
+    temp_file = _MOCK_FILE
     path_to_backup = sdk_helpers.rename_to_bak_file(temp_file)
     assert temp_file == path_to_backup
 
@@ -405,7 +414,7 @@ def test_get_main_cmd(monkeypatch):
 
 def test_get_timestamp():
     now = sdk_helpers.get_timestamp()
-    assert re.match(r"\d\d\d\d\d\d\d\d\d\d\d\d\d\d", now)
+    assert _TS_RE.match(now)
 
 
 def test_get_timestamp_from_timestamp():
@@ -452,6 +461,25 @@ def test_get_package_version_not_found():
     not_found = sdk_helpers.get_package_version("this-package-doesnt-exist")
     assert not_found is None
 
+def test_get_package_version_is_cached():
+    parsed_version = sdk_helpers.get_package_version("resilient-sdk")
+    with patch("resilient_sdk.util.sdk_helpers._read_package_version") as mock_read:
+        assert sdk_helpers.get_package_version("resilient-sdk") is parsed_version
+        mock_read.assert_not_called()
+
+def test_get_package_version_not_cached_when_missing():
+    mock_version = pkg_resources.parse_version("1.2.3")
+    with patch("resilient_sdk.util.sdk_helpers._read_package_version") as mock_read:
+        mock_read.return_value = None
+        assert sdk_helpers.get_package_version("mock-package-installed-later") is None
+
+        # now "installed"
+        mock_read.return_value = mock_version
+        assert sdk_helpers.get_package_version("mock-package-installed-later") == mock_version
+        assert mock_read.call_count == 2
+
+    sdk_helpers._PACKAGE_VERSION_CACHE.pop("mock-package-installed-later", None)
+
 def test_is_python_min_supported_version(caplog):
     mock_log = "WARNING: this package should only be installed on a Python Environment >="
 
@@ -3,7 +3,9 @@
 # (c) Copyright IBM Corp. 2010, 2020. All Rights Reserved.
 
 import difflib
+import itertools
 import os
+import shutil
 import sys
 
 import pkg_resources
@@ -15,6 +17,9 @@ from resilient_sdk.util.sdk_exception import SDKException
 from resilient_sdk.util.sdk_validate_issue import SDKValidateIssue
 from tests.shared_mock_data import mock_paths
 
+_MOCK_TOX_INI_MIN_ENV_ONLY = ('[tox]\n', 'envlist = py36\n', 'skip_missing_interpreters=True\n', '\n', '\n', '[testenv:py36]\n', 'passenv=TEST_RESILIENT_*\n', 'commands = pytest -s {posargs}\n')
+_MOCK_TOX_INI_UNSUPPORTED_ENV = ('[tox]\n', 'envlist = py27,py36,py39\n', 'skip_missing_interpreters=True\n', '\n', '\n', '[testenv:py27]\n', 'passenv=TEST_RESILIENT_*\n', 'commands = pytest -s {posargs}\n')
+
 
 def test_selftest_validate_resilient_circuits_installed():
 
@@ -31,37 +36,28 @@ def test_selftest_validate_resilient_circuits_installed():
         assert "selftest" in result[1].name
 
 
-def test_valid_selftest_validate_package_installed():
+@pytest.mark.parametrize("mock_package_name, expected_installed", [
+    ("resilient-sdk", True),
+    ("fake-package-not-found", False)
+])
+def test_selftest_validate_package_installed(mock_package_name, expected_installed):
 
-    mock_package_name = "resilient-sdk"
     # path_to_package is only used for outputting a solution to install
     mock_path_to_package = "fake/path/to/package"
 
-    # positive case
     attr_dict = sdk_validate_configs.selftest_attributes[1]
     result = sdk_validate_helpers.selftest_validate_package_installed(attr_dict, mock_package_name, mock_path_to_package)
 
     assert len(result) == 2
-    assert result[0]
-    assert result[1].solution == ""
-
-
-def test_invalid_selftest_validate_package_installed():
-
-    mock_package_name = "fake-package-not-found"
-    # path_to_package is only used for outputting a solution to install
-    mock_path_to_package = "fake/path/to/package"
-
-    # negative case
-    attr_dict = sdk_validate_configs.selftest_attributes[1]
-    result = sdk_validate_helpers.selftest_validate_package_installed(attr_dict, mock_package_name, mock_path_to_package)
+    assert result[0] is expected_installed
 
-    assert len(result) == 2
-    assert result[0] is False
-    assert mock_path_to_package in result[1].solution
-    assert "is not installed" in result[1].description
+    if expected_installed:
+        assert result[1].solution == ""
+    else:
+        assert mock_path_to_package in result[1].solution
+        assert "is not installed" in result[1].description
 
-def test_valid_selftest_validate_selftestpy_file_exists(fx_copy_fn_main_mock_integration):
+def test_valid_selftest_validate_selftestpy_file_exists(fx_copy_fn_main_mock_integration_session):
 
     attr_dict = sdk_validate_configs.selftest_attributes[2]
 
@@ -101,7 +97,7 @@ def test_sefltest_run_selftestpy_valid():
         assert result[0]
         assert result[1].severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_sefltest_run_selftestpy_invalid(fx_copy_fn_main_mock_integration):
+def test_sefltest_run_selftestpy_invalid(fx_copy_fn_main_mock_integration_session):
 
     attr_dict = sdk_validate_configs.selftest_attributes[3]
 
@@ -118,7 +114,22 @@ def test_sefltest_run_selftestpy_invalid(fx_copy_fn_main_mock_integration):
         assert result[1].severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
         assert "failed for test reasons" in result[1].description and package_name in result[1].description
 
-def test_sefltest_run_selftestpy_rest_error(fx_copy_fn_main_mock_integration):
+def test_sefltest_run_selftestpy_invalid_multiline_details(fx_copy_fn_main_mock_integration_session):
+
+    attr_dict = sdk_validate_configs.selftest_attributes[3]
+
+    package_name = "fake_package_name"
+
+    with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.run_subprocess") as mock_subprocess:
+
+        mock_subprocess.return_value = 1, "failure {'state': 'failure',\n\t'reason': 'failed for test reasons'} and more text here..."
+
+        result = sdk_validate_helpers.selftest_run_selftestpy(attr_dict, package_name)
+
+        assert result[0] is False
+        assert "'state': 'failure',.  'reason': 'failed for test reasons'" in result[1].description
+
+def test_sefltest_run_selftestpy_rest_error(fx_copy_fn_main_mock_integration_session):
 
     attr_dict = sdk_validate_configs.selftest_attributes[3]
 
@@ -136,12 +147,12 @@ def test_sefltest_run_selftestpy_rest_error(fx_copy_fn_main_mock_integration):
         assert result[1].severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
         assert error_msg in result[1].description
 
-def test_pass_package_files_manifest(fx_copy_fn_main_mock_integration):
+def test_pass_package_files_manifest(fx_copy_fn_main_mock_integration_session, fx_package_file_paths):
 
     filename = "MANIFEST.in"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    package_name = fx_copy_fn_main_mock_integration_session[0]
+    path_file = fx_package_file_paths[filename]
 
     # mock the get_close_matches method to return a match, which will pass the method
     with patch("resilient_sdk.util.sdk_validate_helpers.difflib.get_close_matches") as mock_close_matches:
@@ -154,12 +165,12 @@ def test_pass_package_files_manifest(fx_copy_fn_main_mock_integration):
         assert isinstance(result, SDKValidateIssue)
         assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_fail_package_files_manifest(fx_copy_fn_main_mock_integration):
+def test_fail_package_files_manifest(fx_copy_fn_main_mock_integration_session, fx_package_file_paths):
 
     filename = "MANIFEST.in"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    package_name = fx_copy_fn_main_mock_integration_session[0]
+    path_file = fx_package_file_paths[filename]
 
     # mock the get_close_matches method to return an empty list, which will fail the method
     with patch("resilient_sdk.util.sdk_validate_helpers.difflib.get_close_matches") as mock_close_matches:
@@ -172,11 +183,11 @@ def test_fail_package_files_manifest(fx_copy_fn_main_mock_integration):
         assert isinstance(result, SDKValidateIssue)
         assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_WARN
 
-def test_pass_package_files_apikey_pem(fx_copy_fn_main_mock_integration):
+def test_pass_package_files_apikey_pem(fx_package_file_paths):
 
     filename = "apikey_permissions.txt"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    path_file = fx_package_file_paths[filename]
 
     result = sdk_validate_helpers.package_files_apikey_pem(path_file, attr_dict)
 
@@ -185,11 +196,11 @@ def test_pass_package_files_apikey_pem(fx_copy_fn_main_mock_integration):
     assert isinstance(result, SDKValidateIssue)
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_fail_package_files_apikey_pem(fx_copy_fn_main_mock_integration):
+def test_fail_package_files_apikey_pem(fx_package_file_paths):
 
     filename = "apikey_permissions.txt"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    path_file = fx_package_file_paths[filename]
 
     # mock the file reading
     with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.read_file") as mock_read_file:
@@ -203,81 +214,48 @@ def test_fail_package_files_apikey_pem(fx_copy_fn_main_mock_integration):
         assert isinstance(result, SDKValidateIssue)
         assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
 
-def test_fail_package_files_template_match_dockerfile(fx_copy_fn_main_mock_integration):
+def test_fail_package_files_apikey_pem_indented_comment(fx_package_file_paths):
 
-    filename = "Dockerfile"
+    filename = "apikey_permissions.txt"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
-    package_version = "fake.version"
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
-
-    # mock the get_close_matches method to return an empty list, which will fail the method
-    with patch("resilient_sdk.util.sdk_validate_helpers.difflib.SequenceMatcher.ratio") as mock_ratio:
-        mock_ratio.return_value = 0.0
-
-        result = sdk_validate_helpers.package_files_template_match(package_name, package_version, path_file, filename, attr_dict)
+    path_file = fx_package_file_paths[filename]
 
-        assert len(result) == 1
-        result = result[0]
-        assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_WARN
-
-def test_pass_package_files_template_match_dockerfile(fx_copy_fn_main_mock_integration):
-
-    filename = "Dockerfile"
-    attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
-    package_version = "fake.version"
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    # mock the file reading
+    with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.read_file") as mock_read_file:
 
-    # mock the get_close_matches method to return an empty list, which will fail the method
-    with patch("resilient_sdk.util.sdk_validate_helpers.difflib.SequenceMatcher.ratio") as mock_ratio:
-        mock_ratio.return_value = 1.0
+        mock_read_file.return_value = ["read_data\n", "  #read_function\n"]
 
-        result = sdk_validate_helpers.package_files_template_match(package_name, package_version, path_file, filename, attr_dict)
+        result = sdk_validate_helpers.package_files_apikey_pem(path_file, attr_dict)
 
         assert len(result) == 1
         result = result[0]
-        assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
+        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
+        assert "read_function" in result.description
+        assert "read_data" not in result.description
 
-def test_fail_package_files_template_match_entrypoint(fx_copy_fn_main_mock_integration):
+@pytest.mark.parametrize("filename, mock_ratio_value, expected_severity", [
+    ("Dockerfile", 0.0, SDKValidateIssue.SEVERITY_LEVEL_WARN),
+    ("Dockerfile", 1.0, SDKValidateIssue.SEVERITY_LEVEL_DEBUG),
+    ("entrypoint.sh", 0.0, SDKValidateIssue.SEVERITY_LEVEL_WARN),
+    ("entrypoint.sh", 1.0, SDKValidateIssue.SEVERITY_LEVEL_DEBUG)
+])
+def test_package_files_template_match(fx_copy_fn_main_mock_integration_session, fx_package_file_paths, filename, mock_ratio_value, expected_severity):
 
-    filename = "entrypoint.sh"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
+    package_name = fx_copy_fn_main_mock_integration_session[0]
     package_version = "fake.version"
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    path_file = fx_package_file_paths[filename]
 
-    # mock the get_close_matches method to return an empty list, which will fail the method
+    # mock the ratio: 0.0 will fail the method and 1.0 will pass it
     with patch("resilient_sdk.util.sdk_validate_helpers.difflib.SequenceMatcher.ratio") as mock_ratio:
-        mock_ratio.return_value = 0.0
+        mock_ratio.return_value = mock_ratio_value
 
         result = sdk_validate_helpers.package_files_template_match(package_name, package_version, path_file, filename, attr_dict)
 
         assert len(result) == 1
         result = result[0]
         assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_WARN
-
-def test_pass_package_files_template_match_entrypoint(fx_copy_fn_main_mock_integration):
-
-    filename = "entrypoint.sh"
-    attr_dict = sdk_validate_configs.package_files.get(filename)
-    package_name = fx_copy_fn_main_mock_integration[0]
-    package_version = "fake.version"
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
-
-    # mock the get_close_matches method to return an empty list, which will fail the method
-    with patch("resilient_sdk.util.sdk_validate_helpers.difflib.SequenceMatcher.ratio") as mock_ratio:
-        mock_ratio.return_value = 1.0
-
-        result = sdk_validate_helpers.package_files_template_match(package_name, package_version, path_file, filename, attr_dict)
-
-        assert len(result) == 1
-        result = result[0]
-        assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
+        assert result.severity == expected_severity
 
 def test_difflib_unified_diff_used_in_template_match():
     """A quick test to check that difflib.unified_diff works the same as when we wrote
@@ -288,77 +266,46 @@ def test_difflib_unified_diff_used_in_template_match():
     mock_fromfile_data = ["line 2"]
     mock_tofile_data = ["line 1"]
     
-    diff = difflib.unified_diff(mock_fromfile_data, mock_tofile_data, n=0)
+    diff = list(itertools.islice(difflib.unified_diff(mock_fromfile_data, mock_tofile_data, n=0), 3))
 
     # check that the lines are still the same that we'd expect when this was originally written
-    for i, line in enumerate(diff):
-        if i == 0:
-            assert line.startswith("---")
-        if i == 1:
-            assert line.startswith("+++")
-        if i == 2:
-            assert line.startswith("@@ -1 +1 @@")
-
-def test_pass_package_files_validate_config_py(fx_copy_fn_main_mock_integration):
-    
-    filename = "config.py"
-    attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
-
-    # mock config parsing - return valid config
-    with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_configs_from_config_py") as mock_config:
-
-        mock_config.return_value = ("[fake_config]\nfake=fake", [{'name': 'fake', 'placeholder': 'fake'}])
-
-        result = sdk_validate_helpers.package_files_validate_config_py(path_file, attr_dict)
+    assert len(diff) == 3
+    assert diff[0].startswith("---")
+    assert diff[1].startswith("+++")
+    assert diff[2].startswith("@@ -1 +1 @@")
+
+@pytest.mark.parametrize("mock_return_value, mock_side_effect, expected_severity", [
+    (("[fake_config]\nfake=fake", [{'name': 'fake', 'placeholder': 'fake'}]), None, SDKValidateIssue.SEVERITY_LEVEL_DEBUG),
+    (("", []), None, SDKValidateIssue.SEVERITY_LEVEL_INFO),
+    (None, SDKException("failed"), SDKValidateIssue.SEVERITY_LEVEL_CRITICAL)
+])
+def test_package_files_validate_config_py(fx_package_file_paths, mock_return_value, mock_side_effect, expected_severity):
 
-        assert len(result) == 1
-        result = result[0]
-        assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
-        assert "fake=fake" in result.solution
-
-def test_warn_package_files_validate_config_py(fx_copy_fn_main_mock_integration):
-    
     filename = "config.py"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
+    path_file = fx_package_file_paths[filename]
 
-    # mock config parsing - return no config
+    # mock config parsing - return a valid config, no config or raise an exception
     with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_configs_from_config_py") as mock_config:
 
-        mock_config.return_value = ("", [])
+        mock_config.return_value = mock_return_value
+        mock_config.side_effect = mock_side_effect
 
         result = sdk_validate_helpers.package_files_validate_config_py(path_file, attr_dict)
 
         assert len(result) == 1
         result = result[0]
         assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_INFO
-
-def test_fail_package_files_validate_config_py(fx_copy_fn_main_mock_integration):
-    
-    filename = "config.py"
-    attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
-
-    # mock config parsing - mock raising an exception
-    with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_configs_from_config_py") as mock_config:
+        assert result.severity == expected_severity
 
-        mock_config.side_effect = SDKException("failed")
-
-        result = sdk_validate_helpers.package_files_validate_config_py(path_file, attr_dict)
-
-        assert len(result) == 1
-        result = result[0]
-        assert isinstance(result, SDKValidateIssue)
-        assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
+        if expected_severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG:
+            assert "fake=fake" in result.solution
 
-def test_pass_package_files_validate_customize_py(fx_copy_fn_main_mock_integration):
+def test_pass_package_files_validate_customize_py(fx_package_file_paths):
     
     filename = "customize.py"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
+    path_file = fx_package_file_paths[filename]
 
     # mock import def parsing - given a valid dict (actual validation of the import def happens)
     # in the get_import_definition_from_customize_py which is tested in 
@@ -374,11 +321,11 @@ def test_pass_package_files_validate_customize_py(fx_copy_fn_main_mock_integrati
         assert isinstance(result, SDKValidateIssue)
         assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_fail_package_files_validate_customize_py(fx_copy_fn_main_mock_integration):
+def test_fail_package_files_validate_customize_py(fx_package_file_paths):
     
     filename = "customize.py"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
+    path_file = fx_package_file_paths[filename]
 
     # mock import definition parsing - mock raising an exception
     with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_import_definition_from_customize_py") as mock_import_def:
@@ -392,11 +339,11 @@ def test_fail_package_files_validate_customize_py(fx_copy_fn_main_mock_integrati
         assert isinstance(result, SDKValidateIssue)
         assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
 
-def test_package_files_validate_found_unique_icon(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_found_unique_icon(fx_package_file_paths):
 
     filename = "app_logo.png"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path"))
+    path_file = fx_package_file_paths[filename]
 
     # mock import definition parsing - mock raising an exception
     with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_icon") as mock_icon:
@@ -412,11 +359,11 @@ def test_package_files_validate_found_unique_icon(fx_copy_fn_main_mock_integrati
     assert isinstance(result, SDKValidateIssue)
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_package_files_validate_found_default_icon(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_found_default_icon(fx_package_file_paths):
 
     filename = "app_logo.png"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path"))
+    path_file = fx_package_file_paths[filename]
 
     # mock import definition parsing - mock raising an exception
     with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_icon") as mock_icon:
@@ -431,11 +378,11 @@ def test_package_files_validate_found_default_icon(fx_copy_fn_main_mock_integrat
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_INFO
     assert "'{0}' is the default icon".format(filename) in result.description
 
-def test_package_files_validate_improper_icon(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_improper_icon(fx_package_file_paths):
 
     filename = "app_logo.png"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path"))
+    path_file = fx_package_file_paths[filename]
 
     # mock import definition parsing - mock raising an exception
     with patch("resilient_sdk.util.sdk_validate_helpers.package_helpers.get_icon") as mock_icon:
@@ -450,11 +397,11 @@ def test_package_files_validate_improper_icon(fx_copy_fn_main_mock_integration):
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
     assert "ERROR: Failed for some reason" == result.description
 
-def test_package_files_validate_license_is_default(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_license_is_default(fx_package_file_paths):
 
     filename = "LICENSE"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
+    path_file = fx_package_file_paths[filename]
 
     result = sdk_validate_helpers.package_files_validate_license(path_file, attr_dict, filename)
 
@@ -464,11 +411,11 @@ def test_package_files_validate_license_is_default(fx_copy_fn_main_mock_integrat
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
     assert "'LICENSE' is the default license file" == result.description
 
-def test_package_files_validate_license_is_not_default(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_license_is_not_default(fx_package_file_paths):
 
     filename = "LICENSE"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], attr_dict.get("path").format(fx_copy_fn_main_mock_integration[0]))
+    path_file = fx_package_file_paths[filename]
 
     with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.setup_env_and_render_jinja_file") as mock_jinja_render:
 
@@ -482,24 +429,70 @@ def test_package_files_validate_license_is_not_default(fx_copy_fn_main_mock_inte
     assert "'LICENSE' file is valid" == result[0].description
     assert result[1].severity == SDKValidateIssue.SEVERITY_LEVEL_DEBUG
 
-def test_package_files_validate_readme(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_readme(fx_copy_fn_main_mock_integration_session, fx_package_file_paths):
 
     filename = "README.md"
     attr_dict = sdk_validate_configs.package_files.get(filename)
-    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+    path_file = fx_package_file_paths[filename]
 
-    result = sdk_validate_helpers.package_files_validate_readme(fx_copy_fn_main_mock_integration[1], path_file, filename, attr_dict)
+    result = sdk_validate_helpers.package_files_validate_readme(fx_copy_fn_main_mock_integration_session[1], path_file, filename, attr_dict)
 
     assert len(result) == 1
     result = result[0]
     assert result.severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
     assert "Cannot find one or more screenshots referenced in the README" in result.description
 
-def test_payload_samples_empty(fx_copy_fn_main_mock_integration):
+def test_package_files_validate_readme_placeholder_and_todo(fx_copy_fn_main_mock_integration):
+
+    filename = "README.md"
+    attr_dict = sdk_validate_configs.package_files.get(filename)
+    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+
+    with open(path_file, "w") as f:
+        f.write("# Mock README\n<!-- {0} -->\nTODO: describe the app\n".format(constants.DOCGEN_PLACEHOLDER_STRING))
+
+    result = sdk_validate_helpers.package_files_validate_readme(fx_copy_fn_main_mock_integration[1], path_file, filename, attr_dict)
+
+    assert len(result) == 2
+    assert "still has at least one instance of" in result[0].description
+    assert "still has at least one 'TODO'" in result[1].description
+
+def test_package_files_validate_readme_screenshots(fx_copy_fn_main_mock_integration):
+
+    filename = "README.md"
+    attr_dict = sdk_validate_configs.package_files.get(filename)
+    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+
+    with open(path_file, "w") as f:
+        f.write("# Mock README\n![screenshot: missing](./doc/screenshots/missing.png)\n![screenshot: missing](./doc/screenshots/missing.png)\n")
+
+    result = sdk_validate_helpers.package_files_validate_readme(fx_copy_fn_main_mock_integration[1], path_file, filename, attr_dict)
+
+    assert len(result) == 1
+    assert "Cannot find one or more screenshots referenced in the README" in result[0].description
+    assert result[0].description.count("missing.png") == 1
+
+def test_package_files_validate_readme_link_syntax_error(fx_copy_fn_main_mock_integration):
+
+    filename = "README.md"
+    attr_dict = sdk_validate_configs.package_files.get(filename)
+    path_file = os.path.join(fx_copy_fn_main_mock_integration[1], filename)
+
+    with open(path_file, "w") as f:
+        f.write("# Mock README\n![screenshot: no link]\n")
+
+    result = sdk_validate_helpers.package_files_validate_readme(fx_copy_fn_main_mock_integration[1], path_file, filename, attr_dict)
+
+    assert len(result) == 1
+    assert isinstance(result[0], SDKValidateIssue)
+    assert result[0].severity == SDKValidateIssue.SEVERITY_LEVEL_CRITICAL
+    assert "invalid link syntax" in result[0].description
+
+def test_payload_samples_empty(fx_copy_fn_main_mock_integration_session):
     # NOTE: if the payload samples ever change in the mock integration
     # this will need to be revisited
 
-    mock_path_package = fx_copy_fn_main_mock_integration[1]
+    mock_path_package = fx_copy_fn_main_mock_integration_session[1]
     func_name = "mock_function_two" # this one has empty JSON data
     attr_dict = sdk_validate_configs.payload_samples_attributes
 
@@ -511,18 +504,22 @@ def test_payload_samples_empty(fx_copy_fn_main_mock_integration):
     assert "'output_json_example.json' and 'output_json_schema.json'" in result.description
 
 
-def test_tox_tests_validate_tox_installed(fx_pip_install_tox):
+def test_tox_tests_validate_tox_installed():
 
     attr_dict = sdk_validate_configs.tests_attributes[0]
 
-    result = sdk_validate_helpers.tox_tests_validate_tox_installed(attr_dict)
+    with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.get_package_version") as mock_tox_version:
 
-    assert result[0] == 1
-    assert "'tox' was found in the Python environment" in result[1].description
+        mock_tox_version.return_value = pkg_resources.parse_version(".".join(str(v) for v in constants.TOX_MIN_PACKAGE_VERSION))
 
-def test_tox_tests_validate_tox_file_exists(fx_copy_fn_main_mock_integration):
+        result = sdk_validate_helpers.tox_tests_validate_tox_installed(attr_dict)
 
-    path_package = fx_copy_fn_main_mock_integration[1]
+        assert result[0] == 1
+        assert "'tox' was found in the Python environment" in result[1].description
+
+def test_tox_tests_validate_tox_file_exists(fx_copy_fn_main_mock_integration_session):
+
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.tests_attributes[1]
 
     result = sdk_validate_helpers.tox_tests_validate_tox_file_exists(path_package, attr_dict)
@@ -539,46 +536,55 @@ def test_TOX_MIN_ENV_VERSION_correct_format():
     assert constants.TOX_MIN_ENV_VERSION[2] == "3"
     assert constants.TOX_MIN_ENV_VERSION[-1].isdigit()
 
-def test_tox_tests_validate_min_env_version_only(fx_copy_fn_main_mock_integration):
+def test_tox_tests_validate_min_env_version_only(fx_copy_fn_main_mock_integration_session):
 
-    path_package = fx_copy_fn_main_mock_integration[1]
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.tests_attributes[2]
 
     with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.read_file") as mock_read_file:
 
-        mock_read_file.return_value = ['[tox]\n', 'envlist = py36\n', 'skip_missing_interpreters=True\n', '\n', '\n', '[testenv:py36]\n', 'passenv=TEST_RESILIENT_*\n', 'commands = pytest -s {posargs}\n']
+        mock_read_file.return_value = list(_MOCK_TOX_INI_MIN_ENV_ONLY)
 
         result = sdk_validate_helpers.tox_tests_validate_min_env_version(path_package, attr_dict)
 
         assert result[0] == 1
         assert "Valid 'envlist=' was found in the 'tox.ini' file" in result[1].description
 
-def test_tox_tests_validate_not_min_env_version_only(fx_copy_fn_main_mock_integration):
+def test_tox_tests_validate_not_min_env_version_only(fx_copy_fn_main_mock_integration_session):
 
-    path_package = fx_copy_fn_main_mock_integration[1]
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.tests_attributes[2]
 
     with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.read_file") as mock_read_file:
 
-        mock_read_file.return_value = ['[tox]\n', 'envlist = py27,py36,py39\n', 'skip_missing_interpreters=True\n', '\n', '\n', '[testenv:py27]\n', 'passenv=TEST_RESILIENT_*\n', 'commands = pytest -s {posargs}\n']
+        mock_read_file.return_value = list(_MOCK_TOX_INI_UNSUPPORTED_ENV)
 
         result = sdk_validate_helpers.tox_tests_validate_min_env_version(path_package, attr_dict)
 
         assert result[0] == 1
         assert "Unsupported tox environment found in envlist in 'tox.ini' file" in result[1].description
 
-def test_tox_tests_run_tox_tests(fx_pip_install_tox, fx_copy_and_pip_install_fn_main_mock_integration, caplog):
+def _mock_run_tox_subprocess(args, **__):
+    """Mocks running tox by copying the mock pytest XML report to the --junitxml path in args"""
+    shutil.copyfile(mock_paths.MOCK_PYTEST_XML_REPORT_PATH, args[args.index("--junitxml") + 1])
+    return 1, "Mock tox output"
 
-    path_package = fx_copy_and_pip_install_fn_main_mock_integration[1]
+def test_tox_tests_run_tox_tests(fx_copy_fn_main_mock_integration_session, caplog):
+
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.tests_attributes[3]
 
-    # want to skip using a conftest file as that is irrelevant here
-    args = constants.TOX_TESTS_DEFAULT_ARGS.append("--noconftest")
+    with patch("resilient_sdk.util.sdk_validate_helpers.sdk_helpers.run_subprocess") as mock_subprocess:
 
-    result = sdk_validate_helpers.tox_tests_run_tox_tests(path_package, attr_dict, args, None)
+        mock_subprocess.side_effect = _mock_run_tox_subprocess
 
-    assert "Using mock args" in caplog.text
-    assert result[0] == 1
+        result = sdk_validate_helpers.tox_tests_run_tox_tests(path_package, attr_dict, None, None)
+
+        assert "Using mock args" in caplog.text
+        assert mock_subprocess.call_args[0][0][0] == "tox"
+        assert mock_subprocess.call_args[1].get("change_dir") == path_package
+        assert result[0] == 0
+        assert "record_property" in result[1].description
 
 
 def test_tox_tests_parse_xml_report():
@@ -619,10 +625,10 @@ def test_pylint_validate_pylint_not_installed():
         assert result[1].severity == SDKValidateIssue.SEVERITY_LEVEL_INFO
 
 
-def test_pylint_run_pylint_scan_success(fx_copy_fn_main_mock_integration):
+def test_pylint_run_pylint_scan_success(fx_copy_fn_main_mock_integration_session):
 
-    package_name = fx_copy_fn_main_mock_integration[0]
-    path_package = fx_copy_fn_main_mock_integration[1]
+    package_name = fx_copy_fn_main_mock_integration_session[0]
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.pylint_attributes[1]
 
     with patch("resilient_sdk.util.sdk_validate_helpers.lint.Run") as mock_pylint_run:
@@ -661,10 +667,10 @@ def test_pylint_run_pylint_scan_success(fx_copy_fn_main_mock_integration):
             assert "Pylint scan passed" in result[1].description
 
 
-def test_pylint_run_pylint_scan_failure(fx_copy_fn_main_mock_integration):
+def test_pylint_run_pylint_scan_failure(fx_copy_fn_main_mock_integration_session):
 
-    package_name = fx_copy_fn_main_mock_integration[0]
-    path_package = fx_copy_fn_main_mock_integration[1]
+    package_name = fx_copy_fn_main_mock_integration_session[0]
+    path_package = fx_copy_fn_main_mock_integration_session[1]
     attr_dict = sdk_validate_configs.pylint_attributes[1]
 
     with patch("resilient_sdk.util.sdk_validate_helpers.lint.Run") as mock_pylint_run: